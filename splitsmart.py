@@ -1,49 +1,115 @@
 from __future__ import annotations
+from collections import defaultdict
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Tuple, Optional, Protocol
+from fractions import Fraction
+from typing import List, Dict, DefaultDict, Tuple, Optional, Protocol
+import heapq
 import json
+import math
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # optional: only used to vectorize large splits
+    np = None
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # optional: without it the netting kernel runs as plain Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:  # optional: stdlib json is slower but produces the same schema
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+# Below this many participants the NumPy call overhead outweighs the loop it replaces.
+_VECTORIZE_MIN_PARTICIPANTS = 16
+
 
 # ================ Domain Model ================
 
-@dataclass(eq=True, frozen=True)
+# Money is held as integer paise inside the domain model; rupee floats appear only at I/O.
+def to_paise(amount: float) -> int:
+    if not math.isfinite(amount):
+        raise ValueError(f"Amount must be a finite number, got {amount}")
+    return int(round(amount * 100))
+
+def from_paise(amount_p: int) -> float:
+    return round(amount_p / 100, 2)
+
+def _split_by_weights(amount_p: int, weights: Dict[str, int], total_weight: int) -> Dict[str, int]:
+    """Floor-divide amount in proportion to integer weights; leftover paise go to the first key."""
+    emails = list(weights)
+    # int64 products must not overflow; very fine weights (exact percents) take the bignum path
+    if np is not None and len(emails) >= _VECTORIZE_MIN_PARTICIPANTS and amount_p * total_weight < 2**63:
+        w = np.fromiter(weights.values(), dtype=np.int64, count=len(emails))
+        parts = amount_p * w // total_weight
+        parts[0] += amount_p - int(parts.sum())
+        return dict(zip(emails, parts.tolist()))
+    shares = {e: amount_p * w // total_weight for e, w in weights.items()}
+    shares[emails[0]] += amount_p - sum(shares.values())
+    return shares
+
+@dataclass(eq=False, frozen=True, slots=True)
 class User:
+    """Identified by email alone: equality and hashing ignore the display name."""
     name: str
     email: str
 
+    def __post_init__(self) -> None:
+        # Interned emails make the many email-keyed dict lookups hit the identity fast path
+        object.__setattr__(self, "email", sys.intern(self.email))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, User):
+            return NotImplemented
+        return self.email == other.email
+
+    def __hash__(self) -> int:
+        return hash(self.email)
+
     def __str__(self) -> str:
         return f"{self.name} <{self.email}>"
 
 class SplitStrategy(Protocol):
+    """Shares are returned keyed by participant email (paise), not by User."""
+
     def calculate_shares(
         self,
-        amount: float,
-        participants: List[User],
+        amount_p: int,
+        participants: Tuple[User, ...],
         details: Optional[dict] = None
-    ) -> Dict[User, float]:
+    ) -> Dict[str, int]:
         ...
 
 class EqualSplit:
-    """Split amount equally among participants (rounded to 2 decimals; last gets remainder)."""
+    """Split amount equally among participants (first gets the leftover paise)."""
 
     def calculate_shares(
         self,
-        amount: float,
-        participants: List[User],
+        amount_p: int,
+        participants: Tuple[User, ...],
         details: Optional[dict] = None
-    ) -> Dict[User, float]:
-        n = len(participants)
-        if n == 0:
+    ) -> Dict[str, int]:
+        if not participants:
             raise ValueError("No participants to split among.")
-        base = round(amount / n, 2)
-        shares = {p: base for p in participants}
-        # Adjust rounding remainder
-        distributed = round(sum(shares.values()), 2)
-        remainder = round(amount - distributed, 2)
-        if remainder != 0:
-            # Give remainder to the payer if in list, else to first (will be reassigned by caller if needed)
-            shares[participants[0]] = round(shares[participants[0]] + remainder, 2)
+        base, rem = divmod(amount_p, len(participants))
+        shares = dict.fromkeys((u.email for u in participants), base)
+        if rem:
+            shares[participants[0].email] = base + rem
         return shares
 
 class UnequalSplit:
@@ -51,230 +117,253 @@ class UnequalSplit:
 
     def calculate_shares(
         self,
-        amount: float,
-        participants: List[User],
+        amount_p: int,
+        participants: Tuple[User, ...],
         details: Optional[dict] = None
-    ) -> Dict[User, float]:
+    ) -> Dict[str, int]:
         if not details or "amounts" not in details:
             raise ValueError("UnequalSplit requires details['amounts'].")
-        # Map emails to users
-        email_to_user = {u.email: u for u in participants}
-        amounts: Dict[str, float] = details["amounts"]
+        amounts: Dict[str, int] = {e: to_paise(v) for e, v in details["amounts"].items()}
         # Validate coverage
-        if set(amounts.keys()) != set(email_to_user.keys()):
-            missing = set(email_to_user.keys()) - set(amounts.keys())
-            extra = set(amounts.keys()) - set(email_to_user.keys())
+        if len(amounts) != len(participants) or any(u.email not in amounts for u in participants):
+            emails = {u.email for u in participants}
+            missing = emails - amounts.keys()
+            extra = amounts.keys() - emails
             raise ValueError(f"Amounts keys must match participants emails. Missing={missing}, Extra={extra}")
         # Validate sum
-        total = round(sum(amounts.values()), 2)
-        if round(amount, 2) != total:
-            raise ValueError(f"Amounts must sum to total: {total} != {round(amount,2)}")
-        return {email_to_user[e]: round(v, 2) for e, v in amounts.items()}
+        total = sum(amounts.values())
+        if amount_p != total:
+            raise ValueError(f"Amounts must sum to total: {from_paise(total)} != {from_paise(amount_p)}")
+        return amounts
 
 class PercentSplit:
     """Percentages per participant via details={'percents': {email: percent (0-100)}} sum to 100."""
 
     def calculate_shares(
         self,
-        amount: float,
-        participants: List[User],
+        amount_p: int,
+        participants: Tuple[User, ...],
         details: Optional[dict] = None
-    ) -> Dict[User, float]:
+    ) -> Dict[str, int]:
         if not details or "percents" not in details:
             raise ValueError("PercentSplit requires details['percents'].")
-        email_to_user = {u.email: u for u in participants}
         percents: Dict[str, float] = details["percents"]
-        if set(percents.keys()) != set(email_to_user.keys()):
-            missing = set(email_to_user.keys()) - set(percents.keys())
-            extra = set(percents.keys()) - set(email_to_user.keys())
+        if len(percents) != len(participants) or any(u.email not in percents for u in participants):
+            emails = {u.email for u in participants}
+            missing = emails - percents.keys()
+            extra = percents.keys() - emails
             raise ValueError(f"Percents keys must match participants emails. Missing={missing}, Extra={extra}")
         total_pct = round(sum(percents.values()), 6)
         if abs(total_pct - 100.0) > 1e-6:
             raise ValueError(f"Percents must sum to 100, got {total_pct}")
-        # Compute rounded shares, fix rounding by assigning remainder to the first
-        shares = {}
-        running = 0.0
-        for i, (email, pct) in enumerate(percents.items()):
-            share = round(amount * (pct / 100.0), 2)
-            shares[email] = share
-            running += share
-        remainder = round(amount - round(running, 2), 2)
-        if remainder != 0:
-            first_key = next(iter(percents.keys()))
-            shares[first_key] = round(shares[first_key] + remainder, 2)
-        return {email_to_user[e]: v for e, v in shares.items()}
+        # Exact percents (as typed) scaled to integer weights over a common denominator
+        exact = {e: Fraction(str(pct)) for e, pct in percents.items()}
+        denom = math.lcm(*(f.denominator for f in exact.values()))
+        weights = {e: int(f * denom) for e, f in exact.items()}
+        return _split_by_weights(amount_p, weights, sum(weights.values()))
 
 class SharesSplit:
     """Integer 'shares' per participant via details={'shares': {email: int}} split in ratio of shares."""
 
     def calculate_shares(
         self,
-        amount: float,
-        participants: List[User],
+        amount_p: int,
+        participants: Tuple[User, ...],
         details: Optional[dict] = None
-    ) -> Dict[User, float]:
+    ) -> Dict[str, int]:
         if not details or "shares" not in details:
             raise ValueError("SharesSplit requires details['shares'].")
-        email_to_user = {u.email: u for u in participants}
         shares_map: Dict[str, int] = details["shares"]
-        if set(shares_map.keys()) != set(email_to_user.keys()):
-            missing = set(email_to_user.keys()) - set(shares_map.keys())
-            extra = set(shares_map.keys()) - set(email_to_user.keys())
+        if len(shares_map) != len(participants) or any(u.email not in shares_map for u in participants):
+            emails = {u.email for u in participants}
+            missing = emails - shares_map.keys()
+            extra = shares_map.keys() - emails
             raise ValueError(f"Shares keys must match participants emails. Missing={missing}, Extra={extra}")
-        total_shares = sum(int(v) for v in shares_map.values())
+        weights = {e: int(v) for e, v in shares_map.items()}
+        total_shares = sum(weights.values())
         if total_shares <= 0:
             raise ValueError("Total shares must be positive.")
-        shares = {}
-        running = 0.0
-        for email, s in shares_map.items():
-            part = round(amount * (int(s) / total_shares), 2)
-            shares[email] = part
-            running += part
-        remainder = round(amount - round(running, 2), 2)
-        if remainder != 0:
-            first_key = next(iter(shares_map.keys()))
-            shares[first_key] = round(shares[first_key] + remainder, 2)
-        return {email_to_user[e]: v for e, v in shares.items()}
-
-@dataclass
+        return _split_by_weights(amount_p, weights, total_shares)
+
+@dataclass(slots=True)
 class Expense:
     description: str
-    amount: float
+    amount: int                 # paise
     payer: User
-    participants: List[User]
+    participants: Tuple[User, ...]
     strategy_name: str
     details: Optional[dict] = None
-
-    def calculate_splits(self) -> Dict[User, float]:
-        strategy = strategy_from_name(self.strategy_name)
-        return strategy.calculate_shares(self.amount, self.participants, self.details)
+    _strategy: Optional[SplitStrategy] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.strategy_name = self.strategy_name.strip().lower()
+
+    def calculate_splits(self) -> Dict[str, int]:
+        if self._strategy is None:   # resolved on first use, then reused
+            self._strategy = strategy_from_name(self.strategy_name)
+        return self._strategy.calculate_shares(self.amount, self.participants, self.details)
+
+    def calculate_splits_by_user(self, email_index: Optional[Dict[str, User]] = None) -> Dict[User, int]:
+        if email_index is None:
+            email_index = {u.email: u for u in self.participants}
+        return {email_index[e]: v for e, v in self.calculate_splits().items()}
+
+# Strategies are stateless, so one shared instance per split type (keyed by every accepted alias)
+_EQUAL, _UNEQUAL, _PERCENT, _SHARES = EqualSplit(), UnequalSplit(), PercentSplit(), SharesSplit()
+_STRATEGIES: Dict[str, SplitStrategy] = {
+    "equal": _EQUAL,
+    "unequal": _UNEQUAL, "amounts": _UNEQUAL,
+    "percent": _PERCENT, "percentage": _PERCENT, "percents": _PERCENT,
+    "shares": _SHARES, "ratio": _SHARES,
+}
 
 def strategy_from_name(name: str) -> SplitStrategy:
-    key = name.strip().lower()
-    if key in ("equal",):
-        return EqualSplit()
-    if key in ("unequal", "amounts"):
-        return UnequalSplit()
-    if key in ("percent", "percentage", "percents"):
-        return PercentSplit()
-    if key in ("shares", "ratio"):
-        return SharesSplit()
-    raise ValueError(f"Unknown split type '{name}'")
+    try:
+        return _STRATEGIES[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown split type '{name}'") from None
 
 # ================ Debt Manager ================
 
+@njit(cache=True)
+def _net_transfers(debtor_amts, creditor_amts, out_debtor, out_creditor, out_paise):
+    """
+    Greedy netting: repeatedly settle the largest debtor against the largest creditor.
+    Takes amounts owed / owed-to (paise, >0) and writes transfer k as
+    (out_debtor[k], out_creditor[k], out_paise[k]) into preallocated buffers; returns the count.
+    """
+    debtors = [(-debtor_amts[i], i) for i in range(len(debtor_amts))]       # max-heaps via negation
+    creditors = [(-creditor_amts[j], j) for j in range(len(creditor_amts))]
+    heapq.heapify(debtors)
+    heapq.heapify(creditors)
+    k = 0
+    while debtors and creditors:
+        d_amt, d = heapq.heappop(debtors)
+        c_amt, c = heapq.heappop(creditors)
+        pay = min(-d_amt, -c_amt)
+        out_debtor[k] = d
+        out_creditor[k] = c
+        out_paise[k] = pay
+        k += 1
+        if d_amt + pay < 0:
+            heapq.heappush(debtors, (d_amt + pay, d))
+        if c_amt + pay < 0:
+            heapq.heappush(creditors, (c_amt + pay, c))
+    return k
+
 class DebtManager:
     """
-    Track directed debts as map[(debtor_email, creditor_email)] = amount (>0).
-    Provides simplification via netting balances.
+    Track net balance per user in paise (positive = is owed, negative = owes).
+    Directed debts map[(debtor_email, creditor_email)] = paise (>0) is derived lazily
+    from the balances via netting, only when it is viewed or saved. Circular obligations
+    (A->B->C->A) cancel out in the balances, so no separate cycle-removal pass is needed.
     """
 
     def __init__(self) -> None:
-        self.debts: Dict[Tuple[str, str], float] = {}
-
-    def _add_debt(self, debtor: User, creditor: User, amount: float) -> None:
-        if debtor.email == creditor.email:
-            return
-        key = (debtor.email, creditor.email)
-        self.debts[key] = round(self.debts.get(key, 0.0) + amount, 2)
-        if self.debts[key] <= 0.009:
-            self.debts.pop(key, None)
+        self.net: DefaultDict[str, int] = defaultdict(int)
+        self._debts: Optional[Dict[Tuple[str, str], int]] = None
+
+    @property
+    def debts(self) -> Dict[Tuple[str, str], int]:
+        if self._debts is None:
+            self.simplify_debts()
+        return self._debts
+
+    @debts.setter
+    def debts(self, debts: Dict[Tuple[str, str], int]) -> None:
+        """Replace balances with those implied by pairwise debts (e.g. restored from file)."""
+        self.net = defaultdict(int)
+        for (debtor, creditor), amt in debts.items():
+            self.net[debtor] -= amt
+            self.net[creditor] += amt
+        self._debts = None
 
     def update_debts_for_expense(self, expense: Expense) -> None:
         splits = expense.calculate_splits()
-        payer = expense.payer
-        for participant, share in splits.items():
-            if participant.email == payer.email:
+        payer = expense.payer.email
+        for email, share in splits.items():
+            if email == payer:
                 continue
-            self._add_debt(participant, payer, share)
-        self.simplify_debts()
-
-    def settle_up(self, payer: User, receiver: User, amount: float) -> None:
-        """Record payment from payer to receiver reducing payer->receiver debt; if inverted, it creates reverse debt reduction."""
-        key = (payer.email, receiver.email)
-        if key not in self.debts:
-            # If there is opposite debt, paying still makes sense (it increases opposite)
-            opp_key = (receiver.email, payer.email)
-            if opp_key in self.debts:
-                # paying receiver when receiver actually owes payer increases receiver's debt
-                self.debts[opp_key] = round(self.debts[opp_key] + amount, 2)
-            else:
-                # No prior debt; treat as overpayment -> creates reverse credit
-                self.debts[opp_key] = round(amount, 2)
-        else:
-            self.debts[key] = round(self.debts[key] - amount, 2)
-            if self.debts[key] <= 0.009:
-                self.debts.pop(key, None)
-        self.simplify_debts()
+            self.net[email] -= share
+            self.net[payer] += share
+        self._debts = None
+
+    def settle_up(self, payer: User, receiver: User, amount_p: int) -> None:
+        """Record payment from payer to receiver; overpaying leaves the receiver owing the payer."""
+        self.net[payer.email] += amount_p
+        self.net[receiver.email] -= amount_p
+        self._debts = None
 
     def simplify_debts(self) -> None:
-        """Convert pairwise debts to minimal transfers using net balances."""
-        # Compute net balance per user
-        net: Dict[str, float] = {}
-        for (debtor, creditor), amt in self.debts.items():
-            net[debtor] = round(net.get(debtor, 0.0) - amt, 2)
-            net[creditor] = round(net.get(creditor, 0.0) + amt, 2)
-
-        debtors = [(u, -bal) for u, bal in net.items() if bal < -0.009]
-        creditors = [(u, bal) for u, bal in net.items() if bal > 0.009]
-        debtors.sort(key=lambda x: x[1], reverse=False)
-        creditors.sort(key=lambda x: x[1], reverse=False)
-
-        simplified: Dict[Tuple[str, str], float] = {}
-        i = j = 0
-        while i < len(debtors) and j < len(creditors):
-            d_email, d_amt = debtors[i]
-            c_email, c_amt = creditors[j]
-            pay = round(min(d_amt, c_amt), 2)
-            if pay > 0:
-                simplified[(d_email, c_email)] = round(simplified.get((d_email, c_email), 0.0) + pay, 2)
-            d_amt = round(d_amt - pay, 2)
-            c_amt = round(c_amt - pay, 2)
-            if d_amt <= 0.009:
-                i += 1
-            else:
-                debtors[i] = (d_email, d_amt)
-            if c_amt <= 0.009:
-                j += 1
-            else:
-                creditors[j] = (c_email, c_amt)
+        """Rebuild debts as minimal transfers from the net balances."""
+        d_emails = [u for u, bal in self.net.items() if bal < 0]
+        c_emails = [u for u, bal in self.net.items() if bal > 0]
+        if not d_emails or not c_emails:
+            self._debts = {}
+            return
+        d_amts = [-self.net[u] for u in d_emails]
+        c_amts = [self.net[u] for u in c_emails]
+        n = len(d_emails) + len(c_emails)   # each transfer retires a debtor or a creditor
+        if _HAVE_NUMBA:
+            d_amts = np.array(d_amts, dtype=np.int64)
+            c_amts = np.array(c_amts, dtype=np.int64)
+            out_d, out_c, out_p = np.empty(n, np.int64), np.empty(n, np.int64), np.empty(n, np.int64)
+        else:
+            out_d, out_c, out_p = [0] * n, [0] * n, [0] * n
+        k = _net_transfers(d_amts, c_amts, out_d, out_c, out_p)
+        if _HAVE_NUMBA:
+            out_d, out_c, out_p = out_d[:k].tolist(), out_c[:k].tolist(), out_p[:k].tolist()
+        self._debts = {(d_emails[out_d[t]], c_emails[out_c[t]]): out_p[t] for t in range(k)}
+
+    def summary_lines(self, users_by_email: Dict[str, User]) -> str:
+        """One "X owes Y ₹amount" line per debt, joined with newlines."""
+        items = sorted(self.debts.items())
+        if not items:
+            return "No outstanding debts."
 
-        # Replace debts
-        self.debts = {k: v for k, v in simplified.items() if v > 0.009}
+        def name(email: str) -> str:
+            user = users_by_email.get(email)
+            return user.name if user else email
 
-    def summary_lines(self, users_by_email: Dict[str, User]) -> List[str]:
-        out = []
-        for (debtor, creditor), amt in sorted(self.debts.items()):
-            d = users_by_email.get(debtor, User(debtor, debtor)).name
-            c = users_by_email.get(creditor, User(creditor, creditor)).name
-            out.append(f"{d} owes {c} ₹{amt:.2f}")
-        if not out:
-            out.append("No outstanding debts.")
-        return out
+        return "\n".join([f"{name(d)} owes {name(c)} ₹{from_paise(amt):.2f}" for (d, c), amt in items])
 
 # ================ Group ================
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     name: str
     members: List[User]
     expenses: List[Expense] = field(default_factory=list)
     debt_manager: DebtManager = field(default_factory=DebtManager)
+    _email_index: Dict[str, User] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._email_index = {u.email: u for u in self.members}
+
+    def has_email(self, email: str) -> bool:
+        return email in self._email_index
 
-    def add_expense(self, expense: Expense) -> None:
-        # Validate participants subset of members
-        emails = {u.email for u in self.members}
-        for p in expense.participants + [expense.payer]:
-            if p.email not in emails:
+    def add_expense(self, expense: Expense, update_debts: bool = True) -> None:
+        """Record expense; update_debts=False only validates and stores it (balances restored elsewhere)."""
+        # Validate participants are distinct members
+        seen = set()
+        for p in expense.participants:
+            if p.email not in self._email_index:
                 raise ValueError(f"User {p} not in group '{self.name}'.")
+            if p.email in seen:
+                raise ValueError(f"Participant {p} listed twice.")
+            seen.add(p.email)
+        if expense.payer.email not in self._email_index:
+            raise ValueError(f"User {expense.payer} not in group '{self.name}'.")
         self.expenses.append(expense)
-        self.debt_manager.update_debts_for_expense(expense)
+        if update_debts:
+            self.debt_manager.update_debts_for_expense(expense)
 
-    def view_debts(self) -> List[str]:
-        return self.debt_manager.summary_lines({u.email: u for u in self.members})
+    def view_debts(self) -> str:
+        return self.debt_manager.summary_lines(self._email_index)
 
-    def settle_up(self, payer: User, receiver: User, amount: float) -> None:
-        self.debt_manager.settle_up(payer, receiver, amount)
+    def settle_up(self, payer: User, receiver: User, amount_p: int) -> None:
+        self.debt_manager.settle_up(payer, receiver, amount_p)
 
 # ================ Persistence ================
 
@@ -293,47 +382,47 @@ class Storage:
                 "name": g.name,
                 "members": [u.email for u in g.members],
                 "expenses": [],
-                "debts": [{"debtor": d, "creditor": c, "amount": amt}
+                "debts": [{"debtor": d, "creditor": c, "amount": from_paise(amt)}
                           for (d, c), amt in g.debt_manager.debts.items()]
             }
             for e in g.expenses:
                 grp["expenses"].append({
                     "description": e.description,
-                    "amount": e.amount,
+                    "amount": from_paise(e.amount),
                     "payer": e.payer.email,
                     "participants": [u.email for u in e.participants],
                     "strategy": e.strategy_name,
                     "details": e.details or {}
                 })
             data["groups"].append(grp)
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(filename, "wb") as f:
+            f.write(_dumps(data))
 
     @staticmethod
     def load(filename: str) -> Tuple[Dict[str, User], Dict[str, Group]]:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filename, "rb") as f:
+            data = _loads(f.read())
         users: Dict[str, User] = {u["email"]: User(u["name"], u["email"]) for u in data.get("users", [])}
         groups: Dict[str, Group] = {}
         for g in data.get("groups", []):
             members = [users[email] for email in g.get("members", []) if email in users]
             group = Group(g["name"], members)
-            # Rebuild expenses
+            # Rebuild expenses; their effect on balances is replaced by the saved debts below
             for e in g.get("expenses", []):
                 payer = users[e["payer"]]
-                participants = [users[em] for em in e["participants"]]
+                participants = tuple(users[em] for em in e["participants"])
                 exp = Expense(
                     description=e["description"],
-                    amount=float(e["amount"]),
+                    amount=to_paise(float(e["amount"])),
                     payer=payer,
                     participants=participants,
                     strategy_name=e["strategy"],
                     details=e.get("details", {})
                 )
-                group.add_expense(exp)
-            # Replace debts from file (trusted) and simplify once
-            group.debt_manager.debts = {(d["debtor"], d["creditor"]): float(d["amount"]) for d in g.get("debts", [])}
-            group.debt_manager.simplify_debts()
+                group.add_expense(exp, update_debts=False)
+            # Replace debts from file (trusted); simplified once, lazily, on first view/save
+            group.debt_manager.debts = {(d["debtor"], d["creditor"]): to_paise(float(d["amount"]))
+                                        for d in g.get("debts", [])}
             groups[group.name] = group
         return users, groups
 
@@ -378,13 +467,13 @@ class SplitSmartApp:
 
         description = input("Enter expense description: ").strip()
         try:
-            amount = float(input("Enter total amount: ").strip())
+            amount = to_paise(float(input("Enter total amount: ").strip()))
         except ValueError:
             print("Invalid amount.")
             return
 
         payer_email = input("Who paid? (email): ").strip().lower()
-        if payer_email not in self.users or self.users[payer_email] not in group.members:
+        if payer_email not in self.users or not group.has_email(payer_email):
             print("Payer must be an existing group member (by email).")
             return
         payer = self.users[payer_email]
@@ -393,12 +482,13 @@ class SplitSmartApp:
         if part_emails:
             participants = []
             for em in [e.strip().lower() for e in part_emails.split(",")]:
-                if em not in self.users or self.users[em] not in group.members:
+                if em not in self.users or not group.has_email(em):
                     print(f"Participant {em} is not a member of the group.")
                     return
                 participants.append(self.users[em])
+            participants = tuple(participants)
         else:
-            participants = list(group.members)
+            participants = tuple(group.members)
 
         split_type = input("Split type (equal / unequal / percent / shares): ").strip().lower()
         details = None
@@ -446,9 +536,7 @@ class SplitSmartApp:
         self._print_debts(self.groups[group_name])
 
     def _print_debts(self, group: Group) -> None:
-        print("Current Debts:")
-        for line in group.view_debts():
-            print(line)
+        print(f"Current Debts:\n{group.view_debts()}")
 
     def settle_up(self) -> None:
         group_name = input("Enter group name: ").strip()
@@ -458,11 +546,15 @@ class SplitSmartApp:
         group = self.groups[group_name]
         payer_email = input("Payer email: ").strip().lower()
         receiver_email = input("Receiver email: ").strip().lower()
-        amount = float(input("Amount: ").strip())
+        try:
+            amount = to_paise(float(input("Amount: ").strip()))
+        except ValueError:
+            print("Invalid amount.")
+            return
         if payer_email not in self.users or receiver_email not in self.users:
             print("Emails must be existing users.")
             return
-        if self.users[payer_email] not in group.members or self.users[receiver_email] not in group.members:
+        if not group.has_email(payer_email) or not group.has_email(receiver_email):
             print("Both users must be group members.")
             return
         group.settle_up(self.users[payer_email], self.users[receiver_email], amount)